@@ -11,6 +11,14 @@ License: 3-Clause-BSD-LBNL
 """
 
 import numpy as np
+from .numba_wrapper import numba_installed
+if numba_installed:
+    from .utilities import build_axis
+
+# Names of the attributes (coordinates, step, min and max) that are
+# registered for the usual axis labels, precomputed once at import
+_AXIS_KEYS = { label: (label, 'd'+label, label+'min', label+'max')
+               for label in 'xyzr' }
 
 
 class FieldMetaInformation(object):
@@ -44,6 +52,8 @@ class FieldMetaInformation(object):
         Notice that the name of these variables change according to
         the values in `axes`. For instance, if `axes` is {0: 'x', 1: 'y'},
         then these variables will be called x, y.
+        (NB: for 3D data reconstructed from thetaMode, x and y are the same
+        read-only array; use e.g. `x.copy()` if it needs to be modified.)
 
     - imshow_extent: 1darray
         (Only for 2D data)
@@ -88,25 +98,34 @@ class FieldMetaInformation(object):
         """
         # Register important initial information
         self.axes = axes
+        self._extent_cache = None
+
+        # Compute the step and start of all the axes at once, in float64
+        # (`position` is not reduced by the readers when slicing,
+        # hence only its first ndim elements are used)
+        ndim = len(axes)
+        if min(len(grid_spacing), len(global_offset), len(position)) < ndim:
+            raise IndexError('`grid_spacing`, `global_offset` and `position` '
+                'should have at least %d elements (one per axis)' % ndim)
+        grid_unitSI = float(grid_unitSI)
+        grid_spacing = np.asarray(grid_spacing, dtype=np.float64)[:ndim]
+        global_offset = np.asarray(global_offset, dtype=np.float64)[:ndim]
+        position = np.asarray(position, dtype=np.float64)[:ndim]
+        steps = grid_spacing * grid_unitSI
+        starts = global_offset * grid_unitSI + position * steps
 
         # Create the elements
-        for axis in sorted(axes.keys()):
-            # Create the coordinates along this axis
-            step = grid_spacing[axis] * grid_unitSI
-            n_points = shape[axis]
-            start = global_offset[axis] * grid_unitSI + position[axis] * step
-            end = start + (n_points - 1) * step
-            axis_points = np.linspace(start, end, n_points, endpoint=True)
-            # Create the points below the axis if thetaMode is true
-            if axes[axis] == 'r' and thetaMode:
-                axis_points = np.concatenate((-axis_points[::-1], axis_points))
-                start = -end
-            # Register the results in the object
-            axis_name = axes[axis]
-            setattr(self, axis_name, axis_points)
-            setattr(self, 'd' + axis_name, step)
-            setattr(self, axis_name + 'min', axis_points[0])
-            setattr(self, axis_name + 'max', axis_points[-1])
+        if ndim == 2:
+            # Most common case: handled without a loop
+            self._register_axis(axes[0], shape[0], starts[0], steps[0],
+                                thetaMode)
+            self._register_axis(axes[1], shape[1], starts[1], steps[1],
+                                thetaMode)
+        else:
+            # (The keys of `axes` are 0, ..., ndim-1)
+            for axis in range(ndim):
+                self._register_axis(axes[axis], shape[axis],
+                                    starts[axis], steps[axis], thetaMode)
 
         # Register current simulation time and iteration in the object
         setattr(self, 'time', t)
@@ -114,7 +133,54 @@ class FieldMetaInformation(object):
 
         self.field_attrs = field_attrs
         self.component_attrs = component_attrs
-        self._generate_imshow_extent()
+
+
+    def _register_axis(self, axis_name, n_points, start, step, thetaMode):
+        """
+        Create the coordinates along the axis `axis_name`,
+        and register them in the object
+        """
+        if numba_installed:
+            axis_points = build_axis(n_points, step, start)
+        else:
+            axis_points = start + step * np.arange(n_points, dtype=np.float64)
+        # Create the points below the axis if thetaMode is true
+        # (mirror the points directly into a single preallocated array)
+        if axis_name == 'r' and thetaMode:
+            full = np.empty(2 * n_points, dtype=axis_points.dtype)
+            np.negative(axis_points[::-1], out=full[:n_points])
+            full[n_points:] = axis_points
+            axis_points = full
+        # Register the results in the object
+        keys = _AXIS_KEYS.get(axis_name)
+        if keys is None:
+            keys = (axis_name, 'd'+axis_name, axis_name+'min', axis_name+'max')
+        k_pts, k_d, k_min, k_max = keys
+        setattr(self, k_pts, axis_points)
+        setattr(self, k_d, step)
+        setattr(self, k_min, axis_points[0])
+        setattr(self, k_max, axis_points[-1])
+
+
+    @property
+    def imshow_extent(self):
+        """
+        (Only for 2D data) The `extent` argument of matplotlib's imshow.
+        It is computed when it is first accessed, and recomputed only
+        after the axes change (see `_remove_axis`).
+        """
+        if len(self.axes) != 2:
+            # (Raising AttributeError keeps `hasattr` False for non-2D data)
+            raise AttributeError('`imshow_extent` is only defined for 2D '
+                'data, but the axes of this object are %s' % self.axes)
+        if self._extent_cache is None:
+            self._extent_cache = self._compute_imshow_extent()
+        return self._extent_cache
+
+    @imshow_extent.setter
+    def imshow_extent(self, value):
+        # Allow users to modify it (e.g. to rescale the coordinates)
+        self._extent_cache = value
 
 
     def restrict_to_1Daxis(self, axis):
@@ -128,7 +194,7 @@ class FieldMetaInformation(object):
             This has to be one of the keys of the self.axes dictionary
         """
         # Check if axis is a valid key
-        if (axis in self.axes.values()) is False:
+        if axis not in self.axes.values():
             raise ValueError('`axis` is not one of the coordinates '
                              'that are present in this object.')
 
@@ -138,23 +204,30 @@ class FieldMetaInformation(object):
                 self._remove_axis(obsolete_axis)
 
 
-    def _generate_imshow_extent(self):
+    def _compute_imshow_extent(self):
         """
-        Generate the list `imshow_extent`, which can be used directly
+        Return the array `imshow_extent`, which can be used directly
         as the argument `extent` of matplotlib's `imshow` command
         """
-        if len(self.axes) == 2:
-            self.imshow_extent = []
-            for label in [self.axes[1], self.axes[0]]:
-                coord_min = getattr( self, label+'min' )
-                coord_max = getattr( self, label+'max' )
-                coord_step = getattr( self, 'd'+label )
-                self.imshow_extent += [ coord_min - 0.5*coord_step,
-                                   coord_max + 0.5*coord_step ]
-            self.imshow_extent = np.array(self.imshow_extent)
-        else:
-            if hasattr(self, 'imshow_extent'):
-                delattr(self, 'imshow_extent')
+        # Read the min, max and step from the attributes, which may have
+        # been modified since the object was created
+        # (axes are swapped, as expected by imshow)
+        mn1, mx1, s1 = self._get_axis_extent(self.axes[1])
+        mn0, mx0, s0 = self._get_axis_extent(self.axes[0])
+        e = np.empty(4)
+        e[0] = mn1 - 0.5*s1
+        e[1] = mx1 + 0.5*s1
+        e[2] = mn0 - 0.5*s0
+        e[3] = mx0 + 0.5*s0
+        return e
+
+
+    def _get_axis_extent(self, label):
+        """
+        Return the min, max and step of the axis `label`
+        """
+        return ( getattr(self, label+'min'), getattr(self, label+'max'),
+                 getattr(self, 'd'+label) )
 
 
     def _remove_axis(self, obsolete_axis):
@@ -166,12 +239,9 @@ class FieldMetaInformation(object):
         delattr(self, obsolete_axis + 'max')
         # Rebuild the dictionary `axes`, by including the axis
         # label in the same order, but omitting obsolete_axis
-        ndim = len(self.axes)
-        self.axes = dict( enumerate([
-            self.axes[i] for i in range(ndim) \
-            if self.axes[i] != obsolete_axis ]))
-
-        self._generate_imshow_extent()
+        self.axes = dict( enumerate(
+            v for v in self.axes.values() if v != obsolete_axis ))
+        self._extent_cache = None
 
 
     def _convert_cylindrical_to_3Dcartesian(self):
@@ -186,8 +256,11 @@ class FieldMetaInformation(object):
                 ' can only be applied to a timeseries in thetaMode geometry')
 
         # Create x and y arrays
-        self.x = self.r.copy()
-        self.y = self.r.copy()
+        # (x and y share the same read-only array, instead of two copies)
+        r = self.r
+        r.flags.writeable = False
+        self.x = r
+        self.y = r
         del self.r
 
         # Create dx and dy
@@ -205,3 +278,4 @@ class FieldMetaInformation(object):
 
         # Change axes
         self.axes = {0:'x', 1:'y', 2:'z'}
+        self._extent_cache = None
@@ -9,6 +9,7 @@ Authors: Remi Lehe, Axel Huebl
 License: 3-Clause-BSD-LBNL
 """
 import math
+import numpy as np
 from functools import partial
 try:
     from ipywidgets import widgets, __version__
@@ -269,10 +270,15 @@ class InteractiveViewer(object):
             # Put back the previous value of the refreshing button
             ptcl_refresh_toggle.value = saved_refresh_value
 
+        # Buffer used to find the closest iteration (allocated only once)
+        iteration_diff = np.empty_like(self.iterations)
+
         def change_iteration(change):
             "Plot the result at the required iteration"
             # Find the closest iteration
-            self._current_i = abs(self.iterations - change['new']).argmin()
+            np.subtract(self.iterations, change['new'], out=iteration_diff)
+            np.abs(iteration_diff, out=iteration_diff)
+            self._current_i = iteration_diff.argmin()
             self.current_iteration = self.iterations[ self._current_i ]
             refresh_field()
             refresh_ptcl()
@@ -11,7 +11,9 @@ License: 3-Clause-BSD-LBNL
 import numpy as np
 from tqdm import tqdm
 from .utilities import apply_selection, fit_bins_to_grid, try_array, \
-                        sanitize_slicing, combine_cylindrical_components
+                        sanitize_slicing, combine_cylindrical_components, \
+                        find_closest_index
+from .numba_wrapper import numba_installed
 from .plotter import Plotter
 from .particle_tracker import ParticleTracker
 from .data_reader import DataReader, available_backends
@@ -111,6 +113,8 @@ class OpenPMDTimeSeries(InteractiveViewer):
                               % self.iterations[k])
                         break
 
+        # - Build the correspondence between iterations and their index
+        self._iter_index = {int(it): i for i, it in enumerate(self.iterations)}
         # - Set the current iteration and time
         self._current_i = 0
         self.current_iteration = self.iterations[0]
@@ -621,18 +625,30 @@ class OpenPMDTimeSeries(InteractiveViewer):
             elif t > self.tmax:
                 self._current_i = len(self.t) - 1
             # Find the closest existing iteration
+            # (self.t is sorted, so a binary search is sufficient ; for
+            # short timeseries, the overhead of calling numba dominates)
+            elif numba_installed and len(self.t) > 64:
+                self._current_i = find_closest_index(self.t, t)
             else:
-                self._current_i = abs(self.t - t).argmin()
+                i = np.searchsorted(self.t, t)
+                if i == 0:
+                    self._current_i = 0
+                elif i == len(self.t):
+                    self._current_i = len(self.t) - 1
+                elif (t - self.t[i-1]) <= (self.t[i] - t):
+                    self._current_i = i - 1
+                else:
+                    self._current_i = i
         # If an iteration is requested
         elif (iteration is not None):
-            if (iteration in self.iterations):
-                # Get the index that corresponds to this iteration
-                self._current_i = abs(iteration - self.iterations).argmin()
-            else:
-                iter_list = '\n - '.join([str(it) for it in self.iterations])
+            # Get the index that corresponds to this iteration
+            idx = self._iter_index.get(iteration)
+            if idx is None:
+                iter_list = '\n - '.join(map(str, self.iterations))
                 raise OpenPMDException(
                       "The requested iteration '%s' is not available.\nThe "
                       "available iterations are: \n - %s\n" % (iteration, iter_list))
+            self._current_i = idx
         else:
             raise OpenPMDException(
                 "Please pass either a time (`t`) or an "
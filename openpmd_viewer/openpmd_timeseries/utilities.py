@@ -351,3 +351,42 @@ def construct_3d_from_circ( F3d, Fcirc, x_array, y_array, modes,
                     sin = (expItheta**mode).imag
                     F3d[ix, iy, :] += Fcirc_proj[2*mode-1,:]*cos + \
                         Fcirc_proj[2*mode,:]*sin
+
+
+@jit
+def find_closest_index( sorted_array, value ):
+    """
+    Return the index of the element of `sorted_array` (sorted in
+    increasing order) that is closest to `value`. In case of a tie,
+    the lower index is returned.
+    """
+    # Binary search for the first element that is not below `value`
+    i_low = 0
+    i_high = sorted_array.shape[0]
+    while i_low < i_high:
+        i_mid = (i_low + i_high) // 2
+        if sorted_array[i_mid] < value:
+            i_low = i_mid + 1
+        else:
+            i_high = i_mid
+
+    # Compare with the neighboring element below
+    if i_low == 0:
+        return( 0 )
+    if i_low == sorted_array.shape[0]:
+        return( i_low - 1 )
+    if (value - sorted_array[i_low-1]) <= (sorted_array[i_low] - value):
+        return( i_low - 1 )
+    return( i_low )
+
+
+@jit
+def build_axis( n_points, step, start ):
+    """
+    Return an array of `n_points` evenly-spaced coordinates,
+    starting at `start` and separated by `step`.
+    """
+    axis_points = np.empty( n_points, dtype=np.float64 )
+    for i in range(n_points):
+        axis_points[i] = start + i*step
+    return( axis_points )